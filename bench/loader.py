@@ -0,0 +1,51 @@
+"""Load matrix-commander.py as a module for the benchmarks in bench/.
+
+matrix-commander.py is a script: its argument parser is built in its
+__main__ block. load() imports the script without running it and
+builds the global pargs from the given command line arguments with
+the script's own parser, so the benchmarked functions see the same
+options as in a real run.
+"""
+
+import argparse
+import importlib.util
+import logging
+import os
+
+SCRIPT = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "matrix-commander.py"
+)
+
+
+def argument_parser() -> argparse.ArgumentParser:
+    """Return a parser for the options common to all benchmarks."""
+    ap = argparse.ArgumentParser()
+    ap.add_argument(
+        "--script",
+        default=SCRIPT,
+        help="matrix-commander.py to benchmark, e.g. an older version "
+        "written by: git show REV:matrix-commander.py > old.py",
+    )
+    ap.add_argument(
+        "--runs", type=int, default=3, help="report the best of this many"
+    )
+    return ap
+
+
+def load(script: str, argv: list):
+    """Import script as module mc and set mc.pargs from argv."""
+    spec = importlib.util.spec_from_file_location("mc", script)
+    mc = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mc)
+    mc.logger = logging.getLogger("mc")
+    logging.getLogger().setLevel(logging.WARNING)
+    # run the parser construction of the __main__ block, nothing else
+    with open(script) as f:
+        source = f.read()
+    start = source.index("    # Construct the argument parser")
+    end = source.index("    pargs = ap.parse_args()")
+    code = "\n".join(line[4:] for line in source[start:end].splitlines())
+    namespace = dict(vars(mc))
+    exec(code, namespace)
+    mc.pargs = namespace["ap"].parse_args(argv)
+    return mc
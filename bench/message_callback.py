@@ -0,0 +1,117 @@
+"""Benchmark receiving events: events per second through message_callback().
+
+20,000 synthetic events (text, notice, emote, reaction and redaction)
+from 50 senders in one room are passed through Callbacks.message_callback()
+as by --listen all --listen-self. Output goes to an in-memory stdout.
+
+Usage:
+    python3 bench/message_callback.py
+    git show REV:matrix-commander.py > /tmp/old.py
+    python3 bench/message_callback.py --script /tmp/old.py
+"""
+
+import asyncio
+import io
+import sys
+import time
+import types
+
+from loader import argument_parser, load
+from nio import (
+    Event,
+    MatrixRoom,
+    RedactionEvent,
+    RoomMessageEmote,
+    RoomMessageNotice,
+    RoomMessageText,
+)
+
+EVENTS = 20000
+SENDERS = 50
+
+
+def source(i: int, event_type: str, content: dict, **fields) -> dict:
+    """Return the source of event number i."""
+    return dict(
+        event_id=f"$e{i}",
+        sender=f"@u{i % SENDERS}:example.org",
+        origin_server_ts=1600000000000 + i * 137,
+        type=event_type,
+        content=content,
+        **fields,
+    )
+
+
+def make_events() -> list:
+    """Return EVENTS events, 60% text, the rest in equal parts."""
+    events = []
+    for i in range(EVENTS):
+        kind = i % 10
+        if kind < 6:
+            body = {"msgtype": "m.text", "body": f"hello {i}"}
+            events.append(
+                RoomMessageText.from_dict(source(i, "m.room.message", body))
+            )
+        elif kind == 6:
+            body = {"msgtype": "m.notice", "body": "notice"}
+            events.append(
+                RoomMessageNotice.from_dict(source(i, "m.room.message", body))
+            )
+        elif kind == 7:
+            body = {"msgtype": "m.emote", "body": "waves"}
+            events.append(
+                RoomMessageEmote.from_dict(source(i, "m.room.message", body))
+            )
+        elif kind == 8:
+            relation = {
+                "m.relates_to": {
+                    "rel_type": "m.annotation",
+                    "event_id": "$e0",
+                    "key": "+1",
+                }
+            }
+            events.append(Event.parse_event(source(i, "m.reaction", relation)))
+        else:
+            events.append(
+                RedactionEvent.from_dict(
+                    source(i, "m.room.redaction", {}, redacts="$e1")
+                )
+            )
+    return events
+
+
+async def run(mc, events: list, runs: int) -> float:
+    """Return the best events per second of runs passes."""
+    room = MatrixRoom("!r:example.org", "@me:example.org", True)
+    for u in range(SENDERS):
+        room.add_member(f"@u{u}:example.org", f"User {u}", None)
+    room.name = "Bench room"
+    client = types.SimpleNamespace(
+        store_path=None, user="@me:example.org", user_id="@me:example.org"
+    )
+    callbacks = mc.Callbacks(client)
+    stdout = sys.stdout
+    sys.stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    try:
+        best = 0
+        for _ in range(runs):
+            start = time.perf_counter()
+            for event in events:
+                await callbacks.message_callback(room, event)
+            best = max(best, len(events) / (time.perf_counter() - start))
+    finally:
+        sys.stdout = stdout
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print the result."""
+    args = argument_parser().parse_args()
+    mc = load(args.script, ["--listen", "all", "--listen-self"])
+    mc.initial_check_of_args()
+    rate = asyncio.run(run(mc, make_events(), args.runs))
+    print(f"message_callback: {rate:12,.0f} events/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark formatting messages: messages per second of each text format.
+
+build_message_content() is called for 10,000 distinct markdown list
+items, which always miss the cache of rendered markdown, for 20,000
+repetitions of 20 lines, e.g. repeated log lines, and for the code and
+html formats. A matrix-commander.py from before
+build_message_content() existed is benchmarked with the content
+building of its send_message(), i.e. its module-level markdown() that
+converts each message from scratch.
+
+Usage:
+    python3 bench/message_content.py
+    git show REV:matrix-commander.py > /tmp/old.py
+    python3 bench/message_content.py --script /tmp/old.py
+"""
+
+import random
+import time
+
+from loader import argument_parser, load
+
+WORDS = (
+    "alpha *beta* `gamma` delta [link](https://example.org) epsilon **zeta**"
+).split()
+
+
+def make_messages() -> tuple:
+    """Return lists of distinct and of repeated messages."""
+    random.seed(1)
+    distinct = [
+        "- " + " ".join(random.choices(WORDS, k=12)) + f" {i}"
+        for i in range(2000)
+    ]
+    repeated = [distinct[i % 20] for i in range(20000)]
+    return distinct * 5, repeated
+
+
+def content_builder(mc):
+    """Return the function of mc that builds the content of a message."""
+    if hasattr(mc, "build_message_content"):
+        return mc.build_message_content
+
+    def build_message_content(message: str, text_format: str) -> dict:
+        # as in send_message() of older versions
+        content = {"msgtype": "m.text"}
+        if text_format == "code":
+            content["format"] = "org.matrix.custom.html"
+            content["formatted_body"] = (
+                "<pre><code>" + message + "</code></pre>"
+            )
+        elif text_format == "markdown":
+            content["format"] = "org.matrix.custom.html"
+            content["formatted_body"] = mc.markdown(message)
+        elif text_format == "html":
+            content["format"] = "org.matrix.custom.html"
+            content["formatted_body"] = message
+        content["body"] = message
+        return content
+
+    return build_message_content
+
+
+def rate(build, messages: list, text_format: str, runs: int) -> float:
+    """Return the best messages per second of runs passes."""
+    best = 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        for message in messages:
+            build(message, text_format)
+        best = max(best, len(messages) / (time.perf_counter() - start))
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    args = argument_parser().parse_args()
+    mc = load(args.script, ["-m", "bench"])
+    build = content_builder(mc)
+    distinct, repeated = make_messages()
+    for name, messages, text_format in [
+        ("markdown distinct", distinct, "markdown"),
+        ("markdown repeated", repeated, "markdown"),
+        ("code distinct", distinct, "code"),
+        ("html distinct", distinct, "html"),
+    ]:
+        result = rate(build, messages, text_format, args.runs)
+        print(f"{name:20s} {result:12,.0f} messages/sec")
+
+
+if __name__ == "__main__":
+    main()